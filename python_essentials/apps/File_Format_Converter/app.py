@@ -1,53 +1,177 @@
-import glob
 import os
 import sys
 import json
-import re
-import pandas as pd
+import functools
+import csv
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
+# Functions used to cast CSV values based on schema data types
+CASTS = {
+    'integer': int,
+    'float': float,
+    'string': str,
+    'timestamp': str  # kept as written in the CSV file
+}
 
-def get_column_names(schemas, ds_name, sorting_key='column_position'):
+# Arrow types used to parse CSV columns based on schema data types
+ARROW_TYPES = {
+    'integer': pa.int64(),
+    'float': pa.float64(),
+    'string': pa.string(),
+    'timestamp': pa.timestamp('ms')
+}
+
+# orjson options used to serialize each record as a JSON line
+ORJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE
+
+# Schema definitions of the source datasets, set by load_schemas
+_SCHEMAS = {}
+
+
+def load_schemas(src_base_dir):
     """
-    Get the list of column names for a given dataset based on the schema.
+    Load the schemas.json file of a source directory into the module-level schemas.
+
+    The loaded schemas are used by the column lookups of this module, whose
+    memoized results are reset on every load.
+
+    Args:
+        src_base_dir (str): Base directory containing datasets and schema.
+
+    Returns:
+        dict: Loaded schema definitions.
+    """
+    global _SCHEMAS
+    with open(f'{src_base_dir}/schemas.json') as schemas_file:
+        _SCHEMAS = json.load(schemas_file)
+    get_sorted_columns.cache_clear()
+    get_column_names.cache_clear()
+    get_column_casts.cache_clear()
+    get_column_spec.cache_clear()
+    return _SCHEMAS
+
+
+@functools.lru_cache(maxsize=None)
+def get_sorted_columns(ds_name, sorting_key='column_position'):
+    """
+    Get the column details of a given dataset from the loaded schema, in column order.
+
+    Results are memoized, so the columns are sorted only once per dataset.
 
     Args:
-        schemas (dict): Loaded schema JSON.
         ds_name (str): Dataset name (e.g., 'orders', 'customers').
         sorting_key (str): Key used to sort columns (default is 'column_position').
 
     Returns:
-        List[str]: Sorted list of column names.
+        Tuple[dict, ...]: Sorted column details.
+    """
+    column_details = _SCHEMAS[ds_name]
+    return tuple(sorted(column_details, key=lambda col: col[sorting_key]))
+
+
+@functools.lru_cache(maxsize=None)
+def get_column_names(ds_name):
+    """
+    Get the column names for a given dataset based on the loaded schema.
+
+    Args:
+        ds_name (str): Dataset name (e.g., 'orders', 'customers').
+
+    Returns:
+        Tuple[str, ...]: Sorted column names.
     """
-    column_details = schemas[ds_name]
-    columns = sorted(column_details, key=lambda col: col[sorting_key])
-    return [col['column_name'] for col in columns]
+    return tuple(col['column_name'] for col in get_sorted_columns(ds_name))
 
 
-def read_csv(file, schemas):
+def infer_value(value):
     """
-    Read a CSV file using schema-based column names.
+    Cast a CSV value to int or float when possible, otherwise keep it as a string.
+
+    Args:
+        value (str): Raw CSV value.
+
+    Returns:
+        Union[int, float, str]: Typed value.
+    """
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def cast_value(cast, value):
+    """
+    Cast a CSV value with the cast function of its column.
+
+    Empty or missing values become None, and values the cast function cannot
+    handle have their type inferred instead.
+
+    Args:
+        cast (Callable): Cast function of the column.
+        value (Optional[str]): Raw CSV value, None when the field is missing.
+
+    Returns:
+        Any: Typed value.
+    """
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        return infer_value(value)
+
+
+@functools.lru_cache(maxsize=None)
+def get_column_casts(ds_name):
+    """
+    Get the cast functions for the columns of a dataset, in column order.
+
+    Columns without a recognised data type have their values inferred.
+
+    Args:
+        ds_name (str): Dataset name (e.g., 'orders', 'customers').
+
+    Returns:
+        Tuple[Callable, ...]: Cast function for each column.
+    """
+    return tuple(CASTS.get(col['data_type'], infer_value) for col in get_sorted_columns(ds_name))
+
+
+def read_csv(file):
+    """
+    Stream the records of a CSV file using schema-based column names and types.
+
+    Rows are read one at a time, so memory usage does not grow with the file size.
 
     Args:
         file (str): Full path to the CSV file.
-        schemas (dict): Loaded schema JSON.
 
     Returns:
-        pd.DataFrame: DataFrame with properly named columns.
+        Iterator[dict]: One record per row, with empty or missing fields as None.
     """
-    file_path_list = re.split('[/\\\]', file)
-    ds_name = file_path_list[-2]  # Dataset name from folder
-    file_name = file_path_list[-1]
-    columns = get_column_names(schemas, ds_name)
-    df = pd.read_csv(file, names=columns)
-    return df
+    ds_name = os.path.basename(os.path.dirname(file))  # Dataset name from folder
+    columns = get_column_names(ds_name)
+    casts = get_column_casts(ds_name)
+    with open(file, newline='', encoding='utf-8') as csv_file:
+        for row in csv.reader(csv_file):
+            row += [None] * (len(columns) - len(row))  # short rows get null fields
+            yield {
+                column: cast_value(cast, value)
+                for column, cast, value in zip(columns, casts, row)
+            }
 
 
-def to_json(df, tgt_base_dir, ds_name, file_name):
+def to_json(records, tgt_base_dir, ds_name, file_name):
     """
-    Convert a DataFrame to newline-delimited JSON and save it.
+    Write records to a newline-delimited JSON file using orjson.
 
     Args:
-        df (pd.DataFrame): DataFrame to convert.
+        records (Iterable[dict]): Records to write.
         tgt_base_dir (str): Target base directory to store JSON files.
         ds_name (str): Dataset name.
         file_name (str): Name of the JSON file to be saved.
@@ -55,46 +179,141 @@ def to_json(df, tgt_base_dir, ds_name, file_name):
     json_file_path = f'{tgt_base_dir}/{ds_name}/{file_name}'
     os.makedirs(f'{tgt_base_dir}/{ds_name}', exist_ok=True)
 
-    df.to_json(
-        json_file_path,
-        orient='records',
-        lines=True  # JSON lines format
+    with open(json_file_path, 'wb') as json_file:
+        json_file.writelines(
+            orjson.dumps(record, option=ORJSON_OPTIONS)  # JSON lines format
+            for record in records
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_column_spec(ds_name):
+    """
+    Get the column names and Arrow types of a dataset for CSV parsing.
+
+    Columns without a recognised data type are left out of the types so they are inferred.
+
+    Args:
+        ds_name (str): Dataset name (e.g., 'orders', 'customers').
+
+    Returns:
+        Tuple[Tuple[str, ...], Dict[str, pa.DataType]]: Column names in order and Arrow type by column name.
+    """
+    column_names = get_column_names(ds_name)
+    column_types = {
+        col['column_name']: ARROW_TYPES[col['data_type']]
+        for col in _SCHEMAS[ds_name]
+        if col['data_type'] in ARROW_TYPES
+    }
+    return column_names, column_types
+
+
+def read_csv_table(file):
+    """
+    Read a CSV file into an Arrow table using schema-based column names and types.
+
+    Args:
+        file (str): Full path to the CSV file.
+
+    Returns:
+        pa.Table: Arrow table with properly named and typed columns.
+    """
+    ds_name = os.path.basename(os.path.dirname(file))  # Dataset name from folder
+    column_names, column_types = get_column_spec(ds_name)
+    return pacsv.read_csv(
+        file,
+        read_options=pacsv.ReadOptions(column_names=list(column_names)),
+        convert_options=pacsv.ConvertOptions(
+            column_types=column_types,
+            strings_can_be_null=True  # empty fields as null, same as the JSON output
+        )
     )
 
 
-def file_converter(src_base_dir, tgt_base_dir, ds_name):
+def to_parquet(table, tgt_base_dir, ds_name, file_name):
     """
-    Convert all CSV files for a dataset into JSON format.
+    Write an Arrow table to a zstd compressed Parquet file.
 
     Args:
-        src_base_dir (str): Source directory containing CSV files and schema.
-        tgt_base_dir (str): Destination directory to store JSON files.
+        table (pa.Table): Arrow table to write.
+        tgt_base_dir (str): Target base directory to store Parquet files.
         ds_name (str): Dataset name.
+        file_name (str): Name of the source file, used with a .parquet extension.
+    """
+    parquet_file_path = f'{tgt_base_dir}/{ds_name}/{file_name}.parquet'
+    os.makedirs(f'{tgt_base_dir}/{ds_name}', exist_ok=True)
+
+    pq.write_table(
+        table,
+        parquet_file_path,
+        compression='zstd',
+        use_dictionary=True,
+        data_page_size=1 << 20
+    )
+
+
+def get_part_files(ds_dir):
+    """
+    List the part files (e.g., part-00000) of a dataset folder, largest first.
+
+    Args:
+        ds_dir (str): Dataset folder.
+
+    Returns:
+        List[Tuple[str, int]]: (path, size) of the part files, sorted by size in descending order.
     """
-    schemas = json.load(open(f'{src_base_dir}/schemas.json'))
+    if not os.path.isdir(ds_dir):
+        return []
+    with os.scandir(ds_dir) as entries:
+        part_files = [
+            entry for entry in entries
+            if entry.is_file() and entry.name.startswith('part-')
+        ]
+    part_files = [(entry.path, entry.stat().st_size) for entry in part_files]
+    part_files.sort(key=lambda part_file: part_file[1], reverse=True)
+    return part_files
+
 
+def file_converter(src_base_dir, tgt_base_dir, ds_name, tgt_format='json'):
+    """
+    Convert all CSV files for a dataset into JSON or Parquet format.
+
+    Args:
+        src_base_dir (str): Source directory containing CSV files and schema.
+        tgt_base_dir (str): Destination directory to store converted files.
+        ds_name (str): Dataset name.
+        tgt_format (str): Target file format, 'json' or 'parquet' (default is 'json').
+    """
     # Match files like part-0000.csv inside each dataset folder
-    files = glob.glob(f'{src_base_dir}/{ds_name}/part-*')
+    files = get_part_files(f'{src_base_dir}/{ds_name}')
     if len(files) == 0:
         raise NameError(f"file not found {ds_name}")
 
-    for file in files:
-        df = read_csv(file, schemas)
-        file_name = re.split('[/\\\]', file)[-1]
-        to_json(df, tgt_base_dir, ds_name, file_name)
+    for file, _ in files:
+        file_name = os.path.basename(file)
+        if tgt_format == 'parquet':
+            table = read_csv_table(file)
+            to_parquet(table, tgt_base_dir, ds_name, file_name)
+        else:
+            records = read_csv(file)
+            to_json(records, tgt_base_dir, ds_name, file_name)
 
 
 def process_files(ds_names=None):
     """
-    Process one or multiple datasets and convert them to JSON.
+    Process one or multiple datasets and convert them to JSON, or to Parquet
+    when TGT_FILE_FORMAT is set to 'parquet'.
 
     Args:
         ds_names (list, optional): List of dataset names. If not provided, all datasets in schema will be processed.
     """
     src_base_dir = os.environ.get('SRC_BASE_DIR')
     tgt_base_dir = os.environ.get('TGT_BASE_DIR')
+    tgt_format = os.environ.get('TGT_FILE_FORMAT', 'json')
+    if tgt_format not in ('json', 'parquet'):
+        raise ValueError(f'Unsupported target format {tgt_format}')
 
-    schemas = json.load(open(f'{src_base_dir}/schemas.json'))
+    schemas = load_schemas(src_base_dir)
 
     # If no dataset names provided, process all in schema
     if not ds_names:
@@ -103,7 +322,7 @@ def process_files(ds_names=None):
     for ds_name in ds_names:
         try:
             print(f'Processing {ds_name}')
-            file_converter(src_base_dir, tgt_base_dir, ds_name)
+            file_converter(src_base_dir, tgt_base_dir, ds_name, tgt_format)
         except NameError as ne:
             print(ne)
             print(f"Error processing {ds_name}")
@@ -1,108 +1,389 @@
 import sys
-import glob
+import asyncio
+import concurrent.futures
 import os
 import json
-import re
+import functools
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import multiprocessing
+import asyncpg
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 
+# Schema definitions of the source datasets, set by load_schemas
+_SCHEMAS = {}
 
-def get_column_names(schemas, ds_name, sorting_key='column_position'):
+# Engine shared by the tasks of a worker process, set by init_worker
+_ENGINE = None
+
+# Arrow types used to parse CSV columns based on schema data types
+ARROW_TYPES = {
+    'integer': pa.int64(),
+    'float': pa.float64(),
+    'string': pa.string(),
+    'timestamp': pa.timestamp('ms')
+}
+
+# pandas dtypes used for Arrow columns, keeping integer columns with nulls as integers
+PANDAS_TYPES = {
+    pa.int64(): pd.Int64Dtype()
+}
+
+
+def load_schemas(src_base_dir):
     """
-    Retrieve ordered column names from the schema for a specific dataset.
+    Load the schemas.json file of a source directory into the module-level schemas.
+
+    The loaded schemas are used by the column lookups of this module, whose
+    memoized results are reset on every load.
+
+    Args:
+        src_base_dir (str): Base directory containing datasets and schema.
+
+    Returns:
+        dict: Loaded schema definitions.
+    """
+    global _SCHEMAS
+    with open(f'{src_base_dir}/schemas.json') as schemas_file:
+        _SCHEMAS = json.load(schemas_file)
+    get_column_names.cache_clear()
+    get_column_spec.cache_clear()
+    return _SCHEMAS
+
+
+@functools.lru_cache(maxsize=None)
+def get_column_names(ds_name, sorting_key='column_position'):
+    """
+    Retrieve ordered column names from the loaded schema for a specific dataset.
+
+    Results are memoized, so the columns are sorted only once per dataset.
 
     Args:
-        schemas (dict): Loaded schema definitions.
         ds_name (str): Dataset name (e.g., 'orders', 'customers').
         sorting_key (str): Schema key used to order columns (default: 'column_position').
 
     Returns:
-        List[str]: List of column names in correct order.
+        Tuple[str, ...]: Column names in correct order.
     """
-    column_details = schemas[ds_name]
+    column_details = _SCHEMAS[ds_name]
     columns = sorted(column_details, key=lambda col: col[sorting_key])
-    return [col['column_name'] for col in columns]
+    return tuple(col['column_name'] for col in columns)
 
 
-def read_csv(file, schemas):
+@functools.lru_cache(maxsize=None)
+def get_column_spec(ds_name):
     """
-    Read a CSV file into a chunked DataFrame iterator using schema-based column names.
+    Get the column names and Arrow types of a dataset for CSV parsing.
+
+    Passing the types up front skips type inference on every batch. Columns
+    without a recognised data type are left out of the types so they are inferred.
+
+    Args:
+        ds_name (str): Dataset name (e.g., 'orders', 'customers').
+
+    Returns:
+        Tuple[Tuple[str, ...], Dict[str, pa.DataType]]: Column names in order and Arrow type by column name.
+    """
+    column_names = get_column_names(ds_name)
+    column_types = {
+        col['column_name']: ARROW_TYPES[col['data_type']]
+        for col in _SCHEMAS[ds_name]
+        if col['data_type'] in ARROW_TYPES
+    }
+    return column_names, column_types
+
+
+def read_csv(file, chunksize=10000):
+    """
+    Read a CSV file into a chunked DataFrame iterator using schema-based column names and types.
+
+    The file is streamed with pyarrow's multi-threaded CSV reader and each record
+    batch is split into DataFrames of at most `chunksize` rows.
 
     Args:
         file (str): Full path to the CSV file.
-        schemas (dict): Schema dictionary for column name mapping.
+        chunksize (int): Maximum number of rows per DataFrame (default: 10,000).
 
     Returns:
-        Iterator[pd.DataFrame]: Chunked DataFrame reader (chunksize=10,000).
+        Iterator[pd.DataFrame]: Chunked DataFrame reader.
     """
-    file_path_list = re.split(r'[/\\]', file)
-    ds_name = file_path_list[-2]  # Dataset is the folder name
-    columns = get_column_names(schemas, ds_name)
-    df_reader = pd.read_csv(file, names=columns, chunksize=10000)
-    return df_reader
+    ds_name = os.path.basename(os.path.dirname(file))  # Dataset is the folder name
+    column_names, column_types = get_column_spec(ds_name)
+    batch_reader = pacsv.open_csv(
+        file,
+        read_options=pacsv.ReadOptions(column_names=list(column_names), block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            column_types=column_types,
+            strings_can_be_null=True  # empty fields as null, same as pandas
+        )
+    )
+    for batch in batch_reader:
+        for offset in range(0, batch.num_rows, chunksize):
+            yield batch.slice(offset, chunksize).to_pandas(types_mapper=PANDAS_TYPES.get)
 
 
-def to_sql(df, db_conn_uri, ds_name):
+def get_insert_chunksize(dialect, n_cols):
     """
-    Write a DataFrame to a PostgreSQL table using SQLAlchemy URI.
+    Get the number of rows to read and send per INSERT statement.
+
+    The value can be overridden with the TO_SQL_CHUNKSIZE environment variable
+    so that it can be tuned against a given database.
+
+    Args:
+        dialect (str): SQLAlchemy backend name (e.g., 'mssql', 'mysql').
+        n_cols (int): Number of columns in the table.
+
+    Returns:
+        int: Rows per INSERT statement.
+    """
+    chunksize = os.environ.get('TO_SQL_CHUNKSIZE')
+    if chunksize:
+        return max(1, int(chunksize))  # at least one row per statement
+    if dialect == 'mssql':
+        # SQL Server allows at most 2100 parameters per statement
+        return max(1, min(1000, 2000 // n_cols))
+    if dialect == 'mysql':
+        return 5000
+    return 1000
+
+
+def set_fast_executemany(conn, cursor, statement, parameters, context, executemany):
+    """
+    SQLAlchemy `before_cursor_execute` listener enabling pyodbc's fast_executemany.
+
+    With fast_executemany, pyodbc binds all the rows of an executemany call as a
+    parameter array and sends them in one go instead of one statement per row.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Connection executing the statement.
+        cursor: pyodbc cursor the statement is executed on.
+        statement (str): SQL statement.
+        parameters: Bound parameters.
+        context: SQLAlchemy execution context.
+        executemany (bool): Whether the statement is run with executemany.
+    """
+    if executemany:
+        cursor.fast_executemany = True
+
+
+def create_db_engine(db_conn_uri):
+    """
+    Create the SQLAlchemy engine for a DB URI.
+
+    Engines are not shared across processes, so each multiprocessing worker
+    creates its own in `init_worker` and reuses it for every file it loads.
+
+    Args:
+        db_conn_uri (str): SQLAlchemy connection URI.
+
+    Returns:
+        sqlalchemy.engine.Engine: Engine bound to the DB URI.
+    """
+    engine = create_engine(db_conn_uri, pool_pre_ping=True)
+    if engine.driver == 'pyodbc':
+        event.listen(engine, 'before_cursor_execute', set_fast_executemany)
+    return engine
+
+
+def to_sql(df, conn, ds_name):
+    """
+    Write a DataFrame to a database table using an open connection.
+
+    PostgreSQL targets are loaded with COPY by `copy_file` instead. pyodbc
+    connections use a plain executemany, which fast_executemany sends as one
+    batch. Other databases fall back to multi-row INSERT statements.
 
     Args:
         df (pd.DataFrame): The DataFrame to write.
-        db_conn_uri (str): SQLAlchemy connection URI for PostgreSQL.
+        conn (sqlalchemy.engine.Connection): Open database connection.
         ds_name (str): Target table name (same as dataset name).
     """
+    dialect = conn.dialect.name
+    if conn.dialect.driver == 'pyodbc':
+        method, chunksize = None, None
+    else:
+        method, chunksize = 'multi', get_insert_chunksize(dialect, len(df.columns))
+
     df.to_sql(
         ds_name,
-        db_conn_uri,
+        conn,
         if_exists='append',
-        index=False
+        index=False,
+        method=method,
+        chunksize=chunksize
     )
 
 
-def db_loader(src_base_dir, db_conn_uri, ds_name):
+def get_part_files(ds_dir):
+    """
+    List the part files (e.g., part-00000) of a dataset folder, largest first.
+
+    Args:
+        ds_dir (str): Dataset folder.
+
+    Returns:
+        List[Tuple[str, int]]: (path, size) of the part files, sorted by size in descending order.
+    """
+    if not os.path.isdir(ds_dir):
+        return []
+    with os.scandir(ds_dir) as entries:
+        part_files = [
+            entry for entry in entries
+            if entry.is_file() and entry.name.startswith('part-')
+        ]
+    part_files = [(entry.path, entry.stat().st_size) for entry in part_files]
+    part_files.sort(key=lambda part_file: part_file[1], reverse=True)
+    return part_files
+
+
+def file_loader(engine, ds_name, file):
     """
-    Read CSV files for a dataset and insert into PostgreSQL in chunks.
+    Load a CSV file of a dataset into a non-PostgreSQL database.
+
+    The file is read and inserted in chunks sized for the dialect and the
+    number of columns.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine of the target database.
+        ds_name (str): Dataset name to load.
+        file (str): Full path to the CSV file.
+    """
+    # One transaction per file, committed once the whole file is loaded
+    with engine.begin() as conn:
+        n_cols = len(get_column_names(ds_name))
+        chunksize = get_insert_chunksize(conn.dialect.name, n_cols)
+        df_reader = read_csv(file, chunksize=chunksize)
+        for idx, df in enumerate(df_reader):
+            print(f'Populating chunk {idx} of {file}')
+            to_sql(df, conn, ds_name)
+
+
+def init_worker(src_base_dir, db_conn_uri):
+    """
+    Pool initializer loading the schemas and engine shared by all the tasks of a worker.
+
+    Passing it once per worker keeps the per-task payload small and keeps the
+    DB URI (with credentials) out of the task queue.
 
     Args:
         src_base_dir (str): Base directory containing datasets and schema.
         db_conn_uri (str): SQLAlchemy DB URI.
-        ds_name (str): Dataset name to load.
     """
-    schemas = json.load(open(f'{src_base_dir}/schemas.json'))
-    files = glob.glob(f'{src_base_dir}/{ds_name}/part-*')
+    global _ENGINE
+    load_schemas(src_base_dir)
+    _ENGINE = create_db_engine(db_conn_uri)
 
-    if not files:
-        raise NameError(f'No files found for {ds_name}')
 
-    for file in files:
-        df_reader = read_csv(file, schemas)
-        for idx, df in enumerate(df_reader):
-            print(f'Populating chunk {idx} of {ds_name}')
-            to_sql(df, db_conn_uri, ds_name)
+def process_file(args):
+    """
+    Wrapper function for multiprocessing — processes one file at a time.
+
+    Args:
+        args (Tuple): (ds_name, file)
+    """
+    ds_name, file = args
+    try:
+        print(f'Processing {file}')
+        file_loader(_ENGINE, ds_name, file)
+    except Exception as e:
+        print(e)
+    else:
+        print(f'Data Processing of {file} is completed successfully')
 
 
-def process_dataset(args):
+async def copy_file(conn, file, ds_name):
     """
-    Wrapper function for multiprocessing — processes one dataset at a time.
+    Load a CSV file into a PostgreSQL table by streaming it directly with COPY.
+
+    The file is sent to the server as is, without being parsed in Python, in
+    a single transaction.
 
     Args:
-        args (Tuple): (src_base_dir, db_conn_uri, ds_name)
+        conn (asyncpg.Connection): Open PostgreSQL connection.
+        file (str): Full path to the CSV file.
+        ds_name (str): Target table name (same as dataset name).
+    """
+    async with conn.transaction():
+        # Don't wait for the WAL flush on commit, a failed load is rerun anyway
+        await conn.execute('SET LOCAL synchronous_commit = off')
+        with open(file, 'rb') as csv_file:
+            await conn.copy_to_table(
+                ds_name,
+                source=csv_file,
+                columns=list(get_column_names(ds_name)),
+                format='csv'
+            )
+
+
+async def process_file_async(pool, ds_name, file):
+    """
+    Async counterpart of `process_file` — copies one file using a pooled connection.
+
+    Args:
+        pool (asyncpg.Pool): Connection pool of the target database.
+        ds_name (str): Dataset name to load.
+        file (str): Full path to the CSV file.
     """
-    src_base_dir, db_conn_uri, ds_name = args
     try:
-        print(f'Processing {ds_name}')
-        db_loader(src_base_dir, db_conn_uri, ds_name)
-    except NameError as ne:
-        print(ne)
+        print(f'Processing {file}')
+        async with pool.acquire() as conn:
+            await copy_file(conn, file, ds_name)
     except Exception as e:
         print(e)
-    finally:
-        print(f'Data Processing of {ds_name} is completed successfully')
+    else:
+        print(f'Data Processing of {file} is completed successfully')
+
+
+async def load_files_async(db_conn_uri, pd_args):
+    """
+    Load files into PostgreSQL concurrently from a single process using asyncpg.
+
+    Args:
+        db_conn_uri (str): PostgreSQL connection URI.
+        pd_args (List[Tuple]): (ds_name, file) for each file to load.
+    """
+    # asyncpg only understands plain postgresql:// DSNs, without a SQLAlchemy driver
+    dsn = make_url(db_conn_uri).set(drivername='postgresql').render_as_string(hide_password=False)
+    async with asyncpg.create_pool(dsn, min_size=4, max_size=16) as pool:
+        await asyncio.gather(*(
+            process_file_async(pool, ds_name, file) for ds_name, file in pd_args
+        ))
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion, also when called from a running event loop.
+
+    asyncio.run cannot be nested, so inside a running loop (e.g., a Jupyter
+    notebook) the coroutine gets its own loop in a worker thread.
+
+    Args:
+        coro (Coroutine): Coroutine to run.
+
+    Returns:
+        Any: Result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
 
 def process_files(ds_names=None):
     """
-    Main processing function that sets up DB URI and runs multiprocessing pool.
+    Main processing function that sets up DB URI and loads the files in parallel.
+
+    The target database is taken from DB_CONN_URI when set, otherwise a
+    PostgreSQL URI is built from DB_HOST, DB_PORT, DB_NAME, DB_USER and DB_PASS.
+
+    Files of all the datasets are loaded in parallel, so a single dataset with
+    many part files is spread across the workers as well. PostgreSQL targets
+    are loaded with concurrent asyncpg COPYs from this process; other databases
+    use a multiprocessing pool.
 
     Args:
         ds_names (list, optional): List of dataset names to process. If None, all from schema will be processed.
@@ -114,22 +395,53 @@ def process_files(ds_names=None):
     db_user = os.environ.get('DB_USER')
     db_pass = os.environ.get('DB_PASS')
 
-    # Construct PostgreSQL connection URI
-    db_conn_uri = f'postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}'
+    # Use the given SQLAlchemy URI, or construct a PostgreSQL connection URI
+    db_conn_uri = os.environ.get('DB_CONN_URI') or \
+        f'postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}'
 
-    schemas = json.load(open(f'{src_base_dir}/schemas.json'))
+    schemas = load_schemas(src_base_dir)
     if not ds_names:
         ds_names = schemas.keys()
 
-    # Use up to 8 parallel processes
-    pprocess = min(len(ds_names), 8)
-    pool = multiprocessing.Pool(pprocess)
+    # Prepare arguments for each file of each dataset
+    part_files = []
+    for ds_name in ds_names:
+        files = get_part_files(f'{src_base_dir}/{ds_name}')
+        if not files:
+            print(f'No files found for {ds_name}')
+        part_files.extend((ds_name, file, size) for file, size in files)
+
+    # Start the largest files first to shorten the overall run
+    part_files.sort(key=lambda part_file: part_file[2], reverse=True)
+    pd_args = [(ds_name, file) for ds_name, file, _ in part_files]
+
+    if not pd_args:
+        return
+
+    if make_url(db_conn_uri).get_backend_name() == 'postgresql':
+        # COPY work happens on the server, so async connections are enough
+        run_async(load_files_async(db_conn_uri, pd_args))
+        return
+
+    # Use one process per file, up to the number of CPUs
+    pprocess = min(len(pd_args), os.cpu_count() or 1)
 
-    # Prepare arguments for each dataset
-    pd_args = [(src_base_dir, db_conn_uri, ds_name) for ds_name in ds_names]
+    # Start workers from a clean server process instead of forking this one
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    ctx = multiprocessing.get_context(start_method)
+    if start_method == 'forkserver':
+        ctx.set_forkserver_preload(['pandas', 'pyarrow', 'sqlalchemy'])
 
-    # Run dataset loaders in parallel
-    pool.map(process_dataset, pd_args)
+    # Run file loaders in parallel, handling completions as they arrive.
+    # Workers are replaced after 32 files to bound memory held by pandas/arrow.
+    with ctx.Pool(
+        pprocess,
+        initializer=init_worker,
+        initargs=(src_base_dir, db_conn_uri),
+        maxtasksperchild=32
+    ) as pool:
+        for _ in pool.imap_unordered(process_file, pd_args):
+            pass
 
 
 if __name__ == '__main__':
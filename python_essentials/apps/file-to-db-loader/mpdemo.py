@@ -8,8 +8,9 @@ def mySleep(n):
 
 def main():
     l = [1,2,4,3,5,6,6,8,3]
-    pool = multiprocessing.Pool(8)
-    pool.map(mySleep,l)
+    with multiprocessing.Pool(8) as pool:
+        for _ in pool.imap_unordered(mySleep, l):
+            pass
 
 
 if __name__ == '__main__':